@@ -2,9 +2,12 @@ import sys
 import subprocess
 import os
 import argparse
-import json
 import logging
 import shutil
+import time
+import functools
+import struct
+from collections import deque
 from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication,
@@ -30,15 +33,25 @@ from PySide6.QtCore import Qt, QProcess, QEvent, QTimer, QProcessEnvironment, QS
 from PySide6.QtGui import QIcon, QCloseEvent, QAction, QFont, QPixmap, QPainter, QColor, QFontInfo, QFontDatabase
 from PySide6.QtWidgets import QSystemTrayIcon
 from PySide6.QtNetwork import QLocalServer, QLocalSocket
-import qtawesome as qta
-import qdarktheme
 
 # Configure logging at the beginning of the script
 logging.basicConfig(level=logging.DEBUG, filename='qermital.log', filemode='w',
                     format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
-# Define a unique server name for the single-instance mechanism
+# Base name of the single-instance socket; see single_instance_server_name()
 SERVER_NAME = "QermitalSingleInstanceServer"
+# Messages are prefixed with their length as a 4-byte big-endian integer
+MESSAGE_HEADER_SIZE = 4
+# Larger announced lengths are rejected; a real message is a folder and a command
+MAX_MESSAGE_SIZE = 64 * 1024
+
+# Per-user paths, resolved once at import
+HOME = Path.home()
+XRESOURCES_PATH = HOME / '.Xresources'
+DESKTOP_ENTRY_PATH = HOME / '.local/share/applications/qermital.desktop'
+LOCAL_ICON_DIR = HOME / '.local/share/icons/hicolor/scalable/apps'
+LOCAL_EXEC_PATH = HOME / '.local/bin/qermital'
 
 DEFAULT_SETTINGS = {
     "font_family": "JetBrains Mono",
@@ -47,6 +60,12 @@ DEFAULT_SETTINGS = {
     "foreground_color": "#839496"   # Solarized Dark Base0
 }
 
+# Maximum number of uxterm processes starting at the same time
+MAX_CONCURRENT_SPAWNS = 2
+
+# Settings that a running uxterm can pick up without being restarted
+LIVE_COLOR_SETTINGS = {"background_color", "foreground_color"}
+
 # Define background color options: name -> hex code
 BACKGROUND_COLORS = {
     "Solarized Dark": "#002b36",  # A well-regarded dark theme
@@ -89,6 +108,10 @@ FOREGROUND_COLORS = {
     "Black": "#000000"
 }
 
+# Reverse lookups: lowercase hex code -> color name
+BACKGROUND_COLORS_BY_HEX = {v.lower(): k for k, v in BACKGROUND_COLORS.items()}
+FOREGROUND_COLORS_BY_HEX = {v.lower(): k for k, v in FOREGROUND_COLORS.items()}
+
 COMMON_MONOSPACE_FONTS = {  # Add common monospace fonts without "Mono"
     "Courier",
     "Courier New",
@@ -104,20 +127,41 @@ COMMON_MONOSPACE_FONTS = {  # Add common monospace fonts without "Mono"
     "Inconsolata",
 }
 
+# Monospace families found by get_monospace_fonts(), filled on first use
+_MONOSPACE_FONTS_CACHE = None
+_FONT_DB_WATCHED = False
+
+def _invalidate_monospace_fonts():
+    """Drop the cached monospace list when the font database changes."""
+    global _MONOSPACE_FONTS_CACHE
+    _MONOSPACE_FONTS_CACHE = None
+
 def get_monospace_fonts():
-    """Retrieves monospace font families using QFontDatabase."""
+    """Retrieves monospace font families using QFontDatabase (cached per process)."""
+    global _MONOSPACE_FONTS_CACHE, _FONT_DB_WATCHED
+    if _MONOSPACE_FONTS_CACHE is not None:
+        return _MONOSPACE_FONTS_CACHE
+
     monospace_fonts = []
     for family in QFontDatabase.families():
-        font = QFont(family)
-        if font.exactMatch():
-            info = QFontInfo(font)
-            if info.fixedPitch():
-                monospace_fonts.append(family)
+        if QFontInfo(QFont(family)).fixedPitch():
+            monospace_fonts.append(family)
+
+    app = QApplication.instance()
+    if app and not _FONT_DB_WATCHED:
+        app.fontDatabaseChanged.connect(_invalidate_monospace_fonts)
+        _FONT_DB_WATCHED = True
+    _MONOSPACE_FONTS_CACHE = monospace_fonts
     return monospace_fonts
 
+# Color swatch icons keyed by (color_hex, size), shared across dialogs
+_COLOR_ICON_CACHE = {}
+
 def create_color_icon(color_hex, size=(16, 16)):
     """
     Create a QIcon with a colored square.
+    Icons are cached, so repeated calls for the same color and size
+    return the same QIcon.
 
     Args:
         color_hex (str): Hexadecimal color code (e.g., "#ff0000").
@@ -126,6 +170,11 @@ def create_color_icon(color_hex, size=(16, 16)):
     Returns:
         QIcon: An icon filled with the specified color.
     """
+    key = (color_hex.lower(), tuple(size))
+    icon = _COLOR_ICON_CACHE.get(key)
+    if icon is not None:
+        return icon
+
     pixmap = QPixmap(*size)
     pixmap.fill(Qt.transparent)
     painter = QPainter(pixmap)
@@ -133,42 +182,52 @@ def create_color_icon(color_hex, size=(16, 16)):
     painter.setPen(Qt.NoPen)
     painter.drawRect(0, 0, size[0], size[1])
     painter.end()
-    return QIcon(pixmap)
-
-def check_executable_exists(executable_name):
+    icon = QIcon(pixmap)
+    _COLOR_ICON_CACHE[key] = icon
+    return icon
+
+@functools.lru_cache(maxsize=64)
+def _icon(name, color='blue'):
+    """Return a cached qtawesome icon so menus do not re-render glyphs."""
+    import qtawesome as qta  # Imported on first use; it loads large icon font resources
+    # No size hint: the icon is rendered at whatever size the menu paints it
+    return qta.icon(name, color=color)
+
+def _scan_path_executables(names):
     """
-    Checks if an executable exists in the system's PATH.
+    Walks PATH once and returns the subset of names that are executable files.
 
     Args:
-        executable_name: The name of the executable to check (e.g., "xdotool").
+        names: Iterable of executable names to look for.
 
     Returns:
-        True if the executable is found, False otherwise.
+        set: The names found in PATH with the executable bit set.
     """
-    try:
-        subprocess.run(['which', executable_name], check=True, capture_output=True)
-        return True
-    except subprocess.CalledProcessError:
-        return False
-    except FileNotFoundError:
-        return False
-
-def merge_xresources():
+    wanted = set(names)
+    found = set()
+    for directory in os.environ.get('PATH', os.defpath).split(os.pathsep):
+        if not wanted:
+            break
+        try:
+            with os.scandir(directory or '.') as entries:
+                for entry in entries:
+                    if entry.name in wanted and entry.is_file() and os.access(entry.path, os.X_OK):
+                        found.add(entry.name)
+                        wanted.discard(entry.name)
+        except OSError:
+            continue  # Missing or unreadable PATH entry
+    return found
+
+# Executables Qermital needs at runtime
+REQUIRED_EXECUTABLES = ("xdotool", "uxterm", "xrdb")
+
+def check_dependencies():
     """
-    Checks for xdotool and uxterm, shows QMessageBox and exits if not found.
-    Checks if ~/.Xresources exists and creates it if it doesn't.
-    Then merges ~/.Xresources using xrdb.
-    In ~/.Xresources user can add their custom xterm configuration
-    Raises an exception if xrdb command fails.
+    Checks for xdotool, uxterm and xrdb, shows QMessageBox and exits if not found.
+    Called once at startup.
     """
-
-    missing_executables = []
-    if not check_executable_exists("xdotool"):
-        missing_executables.append("xdotool")
-    if not check_executable_exists("uxterm"):
-        missing_executables.append("uxterm")
-    if not check_executable_exists("xrdb"):
-        missing_executables.append("xrdb")
+    found = _scan_path_executables(REQUIRED_EXECUTABLES)
+    missing_executables = [name for name in REQUIRED_EXECUTABLES if name not in found]
 
     if missing_executables:
         app = QApplication.instance() # Get the existing QApplication instance or None
@@ -185,29 +244,42 @@ def merge_xresources():
         msg_box.exec()
         sys.exit(1) # Exit with a non-zero code to indicate an error
 
-    xresources_path = Path.home() / '.Xresources'
+# Set once ~/.Xresources has been merged; the X resource database is shared by all tabs
+_XRESOURCES_MERGED = False
+
+def merge_xresources():
+    """
+    Checks if ~/.Xresources exists and creates it if it doesn't.
+    Then merges ~/.Xresources using xrdb, once per process.
+    In ~/.Xresources user can add their custom xterm configuration
+    Raises an exception if xrdb command fails.
+    """
+    global _XRESOURCES_MERGED
+    if _XRESOURCES_MERGED:
+        return
+
+    xresources_path = XRESOURCES_PATH
 
     if not xresources_path.exists():
-        print(f"~/.Xresources not found. Creating {xresources_path}")
+        logger.debug("~/.Xresources not found. Creating %s", xresources_path)
         try:
             xresources_path.touch()
-            print(f"Created empty {xresources_path}")
+            logger.debug("Created empty %s", xresources_path)
         except OSError as e:
-            print(f"Error creating {xresources_path}: {e}")
+            logger.error("Error creating %s: %s", xresources_path, e)
             raise  # Re-raise the exception to stop execution if creation fails
 
     try:
-        print(f"Merging {xresources_path} using xrdb...")
+        logger.debug("Merging %s using xrdb...", xresources_path)
         subprocess.run(['xrdb', '-merge', str(xresources_path)], check=True, capture_output=True, text=True)
-        print(f"{xresources_path} merged successfully.")
+        _XRESOURCES_MERGED = True
+        logger.debug("%s merged successfully.", xresources_path)
     except FileNotFoundError:
-        print("Error: xrdb command not found. Is it installed?")
+        logger.error("xrdb command not found. Is it installed?")
         raise  # Re-raise to indicate a critical issue if xrdb is required
     except subprocess.CalledProcessError as e:
-        print(f"Error merging {xresources_path} with xrdb:")
-        print(f"Return code: {e.returncode}")
-        print(f"Stdout: {e.stdout}")
-        print(f"Stderr: {e.stderr}")
+        logger.error("Error merging %s with xrdb (return code %s):\nStdout: %s\nStderr: %s",
+                     xresources_path, e.returncode, e.stdout, e.stderr)
         raise
 
 def create_qermital_desktop_entry():
@@ -215,55 +287,61 @@ def create_qermital_desktop_entry():
     Checks for ~/.local/share/applications/qermital.desktop.
     If not found, creates one with appropriate Exec and Icon paths,
     and registers it as an x-terminal-emulator.
-    Copies qermital.png from MEIPASS to local icon directory.
+    Copies qermital.png from MEIPASS to local icon directory
+    unless an up-to-date copy is already there.
     """
+    if DESKTOP_ENTRY_PATH.exists():
+        return
 
-    desktop_entry_path = Path.home() / '.local/share/applications/qermital.desktop'
+    desktop_entry_path = DESKTOP_ENTRY_PATH
     icon_filename = 'qermital.png'
-    local_icon_dir = Path.home() / '.local/share/icons/hicolor/scalable/apps'
+    local_icon_dir = LOCAL_ICON_DIR
     local_icon_path = local_icon_dir / icon_filename
-    exec_command = Path.home() / '.local/bin/qermital'
-
-    print(f"Checking for desktop entry: {desktop_entry_path}")
+    exec_command = LOCAL_EXEC_PATH
 
-    if not desktop_entry_path.exists():
-        print(f"Desktop entry not found. Creating {desktop_entry_path}")
+    logger.debug("Desktop entry not found. Creating %s", desktop_entry_path)
 
-        # Ensure ~/.local/share/applications directory exists
-        desktop_entry_dir = desktop_entry_path.parent
-        desktop_entry_dir.mkdir(parents=True, exist_ok=True)
+    # Ensure ~/.local/share/applications directory exists
+    desktop_entry_dir = desktop_entry_path.parent
+    desktop_entry_dir.mkdir(parents=True, exist_ok=True)
 
-        # Ensure local icon directory exists
-        local_icon_dir.mkdir(parents=True, exist_ok=True)
+    # Ensure local icon directory exists
+    local_icon_dir.mkdir(parents=True, exist_ok=True)
 
-        # Find icon source path in MEIPASS or fallback to current directory
-        if hasattr(sys, '_MEIPASS'):
-            icon_source_dir = Path(sys._MEIPASS)
+    # Find icon source path in MEIPASS or fallback to the script directory
+    if hasattr(sys, '_MEIPASS'):
+        icon_source_dir = Path(sys._MEIPASS)
+    else:
+        icon_source_dir = Path(__file__).parent # Fallback when not frozen, as in get_resource_path
+    icon_source_path = icon_source_dir / icon_filename
+
+    if not icon_source_path.exists():
+        logger.warning("Icon file '%s' not found at source: %s. Make sure qermital.png is included in your "
+                       "PyInstaller data files or in the current directory for development.",
+                       icon_filename, icon_source_path)
+        default_icon_path = "/usr/share/icons/hicolor/scalable/apps/python3.png" # Example fallback icon - adjust as needed or set to None
+        if default_icon_path and Path(default_icon_path).exists():
+            logger.debug("Using default icon instead: %s", default_icon_path)
+            icon_to_use = default_icon_path
         else:
-            icon_source_dir = Path('.') # Fallback to current directory when not in onefile
-        icon_source_path = icon_source_dir / icon_filename
-
-        if not icon_source_path.exists():
-            print(f"Warning: Icon file '{icon_filename}' not found at source: {icon_source_path}")
-            print("Make sure qermital.png is included in your PyInstaller data files or in the current directory for development.")
-            default_icon_path = "/usr/share/icons/hicolor/scalable/apps/python3.png" # Example fallback icon - adjust as needed or set to None
-            if default_icon_path and Path(default_icon_path).exists():
-                print(f"Using default icon instead: {default_icon_path}")
-                icon_to_use = default_icon_path
+            icon_to_use = None # No icon
+    else:
+        try:
+            # copy2 preserves mtime, so an installed icon at least as new as the source is current
+            if (local_icon_path.exists() and
+                    os.stat(local_icon_path).st_mtime_ns >= os.stat(icon_source_path).st_mtime_ns):
+                logger.debug("Icon already up to date at %s", local_icon_path)
             else:
-                icon_to_use = None # No icon
-        else:
-            try:
-                print(f"Copying icon from {icon_source_path} to {local_icon_path}")
+                logger.debug("Copying icon from %s to %s", icon_source_path, local_icon_path)
                 shutil.copy2(str(icon_source_path), str(local_icon_path)) # copy2 preserves metadata
-                icon_to_use = str(local_icon_path)
-                print(f"Icon copied successfully to {local_icon_path}")
-            except Exception as e:
-                print(f"Error copying icon: {e}")
-                icon_to_use = None # No icon if copy fails
-
-        # Construct .desktop file content with MimeType for x-terminal-emulator
-        desktop_content = f"""[Desktop Entry]
+                logger.debug("Icon copied successfully to %s", local_icon_path)
+            icon_to_use = str(local_icon_path)
+        except Exception as e:
+            logger.error("Error copying icon: %s", e)
+            icon_to_use = None # No icon if copy fails
+
+    # Construct .desktop file content with MimeType for x-terminal-emulator
+    desktop_content = f"""[Desktop Entry]
 Version=1.0
 Type=Application
 Name=Qermital
@@ -275,25 +353,86 @@ Categories=System;TerminalEmulator;
 StartupWMClass=Qermital
 MimeType=application/x-terminal-emulator;
 """
-        if icon_to_use:
-            # If icon was copied, use the full path in the Icon line.
-            # Otherwise 'qermital' will try to find icon in icon themes if available.
-            desktop_content = desktop_content.replace("Icon=qermital", f"Icon={icon_to_use}")
+    if icon_to_use:
+        # If icon was copied, use the full path in the Icon line.
+        # Otherwise 'qermital' will try to find icon in icon themes if available.
+        desktop_content = desktop_content.replace("Icon=qermital", f"Icon={icon_to_use}")
 
 
-        try:
-            with open(desktop_entry_path, 'w') as desktop_file:
-                desktop_file.write(desktop_content)
-            print(f"Desktop entry created at {desktop_entry_path}")
+    try:
+        with open(desktop_entry_path, 'w') as desktop_file:
+            desktop_file.write(desktop_content)
+        logger.debug("Desktop entry created at %s", desktop_entry_path)
 
-            # Make the .desktop file executable (though not strictly necessary for .desktop files)
-            os.chmod(desktop_entry_path, 0o755) # rwxr-xr-x permissions
-            print(f"Desktop entry made executable.")
+        # Make the .desktop file executable (though not strictly necessary for .desktop files)
+        os.chmod(desktop_entry_path, 0o755) # rwxr-xr-x permissions
+        logger.debug("Desktop entry made executable.")
 
-        except Exception as e:
-            print(f"Error creating desktop entry: {e}")
-    else:
-        print(f"Desktop entry already exists at {desktop_entry_path}")
+    except Exception as e:
+        logger.error("Error creating desktop entry: %s", e)
+
+
+class SettingsCache(dict):
+    """
+    In-memory view of the persisted settings.
+    Assigning a key only marks it dirty when the value actually changes,
+    and flush() writes just the dirty keys back to QSettings.
+    """
+
+    def __init__(self, qsettings, defaults):
+        super().__init__(defaults)
+        self._qsettings = qsettings
+        self._dirty = set()
+
+    def __setitem__(self, key, value):
+        if key in self and self[key] == value:
+            return
+        super().__setitem__(key, value)
+        self._dirty.add(key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def load(self, key, default, convert=None):
+        """Read a key from QSettings without marking it dirty."""
+        value = self._qsettings.value(key, default)
+        super().__setitem__(key, convert(value) if convert else value)
+
+    def flush(self, sync=False):
+        """Write dirty keys to QSettings; optionally force them to disk."""
+        for key in self._dirty:
+            self._qsettings.setValue(key, self[key])
+        self._dirty.clear()
+        if sync:
+            self._qsettings.sync()
+
+
+class ColorComboBox(QComboBox):
+    """
+    Combo box of named colors whose swatch icons are painted lazily.
+    Only the selected item gets an icon up front; the rest are added the
+    first time the popup is opened.
+    """
+
+    def __init__(self, colors, parent=None):
+        super().__init__(parent)
+        self._icons_loaded = False
+        for name, hex_code in colors.items():
+            self.addItem(name, hex_code)
+        self.currentIndexChanged.connect(self._load_item_icon)
+        self._load_item_icon(self.currentIndex())
+
+    def _load_item_icon(self, index):
+        if index != -1 and not self._icons_loaded:
+            self.setItemIcon(index, create_color_icon(self.itemData(index)))
+
+    def showPopup(self):
+        if not self._icons_loaded:
+            for index in range(self.count()):
+                self.setItemIcon(index, create_color_icon(self.itemData(index)))
+            self._icons_loaded = True
+        super().showPopup()
 
 
 class SettingsDialog(QDialog):
@@ -318,7 +457,6 @@ class SettingsDialog(QDialog):
         # Filter to show only monospace fonts
         monospace_fonts = get_monospace_fonts()
         if monospace_fonts:
-            self.font_combo.setCurrentFont(QFont(monospace_fonts[0]))
             self.font_combo.setFontFilters(QFontComboBox.MonospacedFonts)
         else:
             self.font_combo.addItem("No monospace fonts found.")
@@ -351,12 +489,9 @@ class SettingsDialog(QDialog):
         # Background Color Selection
         bg_layout = QHBoxLayout()
         bg_label = QLabel("Background Color:")
-        self.bg_combo = QComboBox()
-        for name, hex_code in BACKGROUND_COLORS.items():
-            icon = create_color_icon(hex_code)
-            self.bg_combo.addItem(icon, name)
+        self.bg_combo = ColorComboBox(BACKGROUND_COLORS)
         # Set the current index based on the saved setting
-        current_bg = self.get_color_name(BACKGROUND_COLORS, self.settings["background_color"])
+        current_bg = self.get_color_name(BACKGROUND_COLORS_BY_HEX, self.settings["background_color"])
         bg_index = self.bg_combo.findText(current_bg)
         if bg_index != -1:
             self.bg_combo.setCurrentIndex(bg_index)
@@ -367,12 +502,9 @@ class SettingsDialog(QDialog):
         # Foreground Color Selection
         fg_layout = QHBoxLayout()
         fg_label = QLabel("Foreground Color:")
-        self.fg_combo = QComboBox()
-        for name, hex_code in FOREGROUND_COLORS.items():
-            icon = create_color_icon(hex_code)
-            self.fg_combo.addItem(icon, name)
+        self.fg_combo = ColorComboBox(FOREGROUND_COLORS)
         # Set the current index based on the saved setting
-        current_fg = self.get_color_name(FOREGROUND_COLORS, self.settings["foreground_color"])
+        current_fg = self.get_color_name(FOREGROUND_COLORS_BY_HEX, self.settings["foreground_color"])
         fg_index = self.fg_combo.findText(current_fg)
         if fg_index != -1:
             self.fg_combo.setCurrentIndex(fg_index)
@@ -406,16 +538,17 @@ class SettingsDialog(QDialog):
         revert_button.clicked.connect(self.revert_to_defaults)
         cancel_button.clicked.connect(self.reject)
 
-        # Connect signals for live preview
-        self.font_combo.currentFontChanged.connect(self.update_font_preview)
-        self.size_spin.valueChanged.connect(self.update_font_preview)
+        # Connect signals for live preview, coalescing rapid changes
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(40)
+        self._preview_timer.timeout.connect(self._do_preview_update)
+        self.font_combo.currentFontChanged.connect(self.schedule_font_preview)
+        self.size_spin.valueChanged.connect(self.schedule_font_preview)
 
-    def get_color_name(self, color_dict, hex_code):
+    def get_color_name(self, names_by_hex, hex_code):
         """Retrieve the color name based on the hex code."""
-        for name, code in color_dict.items():
-            if code.lower() == hex_code.lower():
-                return name
-        return ""
+        return names_by_hex.get(hex_code.lower(), "")
 
     def save_settings(self):
         """Save the selected settings and accept the dialog."""
@@ -435,13 +568,13 @@ class SettingsDialog(QDialog):
         self.size_spin.setValue(self.settings["font_size"])
 
         # Set Background Color
-        bg_name = self.get_color_name(BACKGROUND_COLORS, self.settings["background_color"])
+        bg_name = self.get_color_name(BACKGROUND_COLORS_BY_HEX, self.settings["background_color"])
         bg_index = self.bg_combo.findText(bg_name)
         if bg_index != -1:
             self.bg_combo.setCurrentIndex(bg_index)
 
         # Set Foreground Color
-        fg_name = self.get_color_name(FOREGROUND_COLORS, self.settings["foreground_color"])
+        fg_name = self.get_color_name(FOREGROUND_COLORS_BY_HEX, self.settings["foreground_color"])
         fg_index = self.fg_combo.findText(fg_name)
         if fg_index != -1:
             self.fg_combo.setCurrentIndex(fg_index)
@@ -455,24 +588,41 @@ class SettingsDialog(QDialog):
         """Return the updated settings."""
         return self.settings
 
+    def schedule_font_preview(self, *args):
+        """Restart the preview timer so only the settled value is rendered."""
+        self._preview_timer.start()
+
+    def _do_preview_update(self):
+        self.update_font_preview(self.font_combo.currentFont())
+
     def update_font_preview(self, font):
         """Update the font preview based on the selected font and size."""
         if isinstance(font, QFont):
             current_size = self.size_spin.value()
             self.font_preview.setFont(QFont(font.family(), current_size))
         else:
-            logging.warning("Received unexpected font type for preview update.")
+            logger.warning("Received unexpected font type for preview update.")
 
 class XTermWidget(QFrame):
     """Embeddable widget that embeds a uxterm terminal."""
 
-    def __init__(self, initial_directory=None, command=None, parent=None):
+    # uxterm arguments that do not depend on settings
+    _UXTERM_STATIC = (
+        '-bc',               # Enable bold colors
+        '+sb',               # Disable scrollbar
+        '-class', 'UXTerm',  # Ensure class is UXTerm
+    )
+
+    def __init__(self, initial_directory=None, command=None, parent=None, settings=None, spawner=None):
         super().__init__(parent)
         self.initial_directory = initial_directory or os.getcwd()
         self.command = command
-        self.current_settings = DEFAULT_SETTINGS.copy()
+        self.current_settings = (settings or DEFAULT_SETTINGS).copy()
+        self.spawner = spawner  # Limits concurrent uxterm starts, see TerminalEmulator.queue_spawn
+        self._spawn_pending = False
+        self._resize_pending = False
         self.setup_ui()
-        self.start_uxterm()
+        self.request_start()
 
     def setup_ui(self):
         """Initialize the widget UI properties."""
@@ -487,21 +637,34 @@ class XTermWidget(QFrame):
         # Install event filter for resize events
         self.installEventFilter(self)
 
+    def request_start(self):
+        """Start uxterm now, or queue the start when a spawner is set."""
+        if self.spawner:
+            self.spawner.queue_spawn(self)
+        else:
+            self.start_uxterm()
+
     def start_uxterm(self):
         """Start and embed uxterm process."""
+        self._spawn_pending = True
         try:
             # Explicitly load .Xresources
             merge_xresources()
-            logging.debug("Loaded .Xresources successfully.")
+            logger.debug("Loaded .Xresources successfully.")
 
             # Set up environment
             env = QProcessEnvironment.systemEnvironment()
             env.insert("WINDOWID", str(int(self.winId())))
-            env.insert("RESOURCE_MANAGER", str(Path.home() / '.Xresources'))
+            env.insert("RESOURCE_MANAGER", str(XRESOURCES_PATH))
             env.insert("LANG", "en_US.UTF-8")  # Ensure UTF-8 support
             env.insert("TERM", "xterm-256color")  # Ensure TERM supports 256 colors
-            self.process = QProcess(self)
+            self.process = process = QProcess(self)
+            process.started.connect(lambda: self.on_process_started(process))
+            process.errorOccurred.connect(lambda error: self.on_process_error(process, error))
             self.process.setProcessEnvironment(env)
+            # Window IDs and the shell's TTY are resolved on first use for this process
+            self._cached_window_ids = None
+            self._cached_shell_tty = None
             self.process.setWorkingDirectory(self.initial_directory)
 
             # Configure uxterm parameters based on current_settings
@@ -510,107 +673,176 @@ class XTermWidget(QFrame):
             bg_color = self.current_settings.get("background_color", "#002b36")
             fg_color = self.current_settings.get("foreground_color", "#839496")
 
+            # The shell inherits initial_directory via setWorkingDirectory above
             if self.command:
-                bash_command = f'cd "{self.initial_directory}"; {self.command}; exec bash'
+                bash_command = f'{self.command}; exec bash'
             else:
-                bash_command = f'cd "{self.initial_directory}"; exec bash'
+                bash_command = 'exec bash'
 
-            # Base uxterm command
-            uxterm_command = [
-                'uxterm',
+            # uxterm arguments
+            uxterm_args = [
                 '-fa', font_family,
                 '-fs', str(font_size),
                 '-bg', bg_color,
                 '-fg', fg_color,
                 '-cr', fg_color,     # Cursor color same as foreground
-                '-bc',               # Enable bold colors
-                '+sb',               # Disable scrollbar
-                '-class', 'UXTerm',  # Ensure class is UXTerm
+                *self._UXTERM_STATIC,
                 '-into', str(int(self.winId())),
                 '-e', 'bash', '-c', bash_command
             ]
 
-            # Debug: Print the uxterm command for verification
-            logging.debug("Launching uxterm with the following command:")
-            logging.debug(' '.join(uxterm_command))
-            print("Launching uxterm with the following command:")
-            print(' '.join(uxterm_command))
+            # Debug: Log the uxterm command for verification
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Launching uxterm with the following command: uxterm %s", ' '.join(uxterm_args))
 
-            # Start uxterm
-            self.process.start(uxterm_command[0], uxterm_command[1:])  # Pass all arguments after 'uxterm'
-
-            # Check if process started successfully
-            if not self.process.waitForStarted(3000):
-                raise RuntimeError("uxterm failed to start.")
-
-            logging.debug("uxterm started successfully.")
-            # Initial resize after a short delay
-            QTimer.singleShot(100, self.resize_terminal)
+            # Start uxterm; completion is reported by on_process_started/on_process_error
+            self.process.start('uxterm', uxterm_args)
         except subprocess.CalledProcessError as e:
-            logging.error(f"Failed to load .Xresources: {e}")
+            self.finish_spawn()
+            logger.error("Failed to load .Xresources: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to load .Xresources: {e}")
         except Exception as e:
-            logging.error(f"Failed to start uxterm: {e}")
+            self.finish_spawn()
+            logger.error("Failed to start uxterm: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to start uxterm: {e}")
 
+    def on_process_started(self, process):
+        """Handle a successful uxterm start."""
+        if process is not self.process:
+            return  # Signal from a process that has since been replaced
+        logger.debug("uxterm started successfully.")
+        self.finish_spawn()
+        if self.isVisible():
+            # Initial resize after a short delay
+            QTimer.singleShot(100, self.resize_terminal)
+        else:
+            self._resize_pending = True  # Resized in showEvent
+
+    def on_process_error(self, process, error):
+        """Report a uxterm that failed to start."""
+        if process is not self.process or error != QProcess.FailedToStart:
+            return
+        self.finish_spawn()
+        logger.error("Failed to start uxterm: %s", process.errorString())
+        QMessageBox.critical(self, "Error", f"Failed to start uxterm: {process.errorString()}")
+
+    def finish_spawn(self):
+        """Release this widget's spawn slot, if it holds one."""
+        if self._spawn_pending:
+            self._spawn_pending = False
+            if self.spawner:
+                self.spawner.spawn_finished(self)
+
     def apply_settings(self, settings):
-        """Apply new settings to the terminal widget."""
+        """
+        Apply new settings to the terminal widget.
+        Color-only changes are sent to the running terminal; anything else
+        restarts uxterm.
+        """
+        old_settings = self.current_settings
         self.current_settings = settings.copy()
+        changed = {key for key, value in self.current_settings.items() if old_settings.get(key) != value}
+        if not changed:
+            return
+        if changed <= LIVE_COLOR_SETTINGS and self.update_colors():
+            return
         self.restart_uxterm()
 
+    def update_colors(self):
+        """
+        Recolor the running terminal with OSC 10/11/12 escape sequences
+        written to the shell's pty.
+
+        Returns:
+            True if the sequences were written, False otherwise.
+        """
+        if not hasattr(self, 'process') or self.process.state() != QProcess.Running:
+            return False
+        try:
+            if self._cached_shell_tty is None:
+                # The shell started by uxterm owns the pty that xterm reads from
+                output = subprocess.check_output(
+                    ['ps', '-o', 'tty=', '--ppid', str(self.process.processId())]
+                ).decode().split()
+                self._cached_shell_tty = next((tty for tty in output if tty != "?"), "")
+            if not self._cached_shell_tty:
+                return False
+
+            bg_color = self.current_settings["background_color"]
+            fg_color = self.current_settings["foreground_color"]
+            with open(f"/dev/{self._cached_shell_tty}", 'w') as pty:
+                pty.write(f"\x1b]11;{bg_color}\x07\x1b]10;{fg_color}\x07\x1b]12;{fg_color}\x07")
+            logger.debug("Updated terminal colors in place.")
+            return True
+        except (subprocess.CalledProcessError, OSError) as e:
+            logger.warning("Could not update terminal colors in place: %s", e)
+            return False
+
     def restart_uxterm(self):
         """Restart the uxterm process to apply new settings."""
         self.terminate()
-        self.start_uxterm()
+        self.request_start()
 
     def terminate(self):
         """Clean up the uxterm process."""
+        self.request_terminate()
+        self.wait_terminate()
+
+    def request_terminate(self):
+        """Ask the uxterm process to exit (SIGTERM) without waiting for it."""
+        if self.spawner:
+            self.spawner.cancel_spawn(self)
+        self.finish_spawn()
         if hasattr(self, 'process') and self.process.state() != QProcess.NotRunning:
             self.process.terminate()
-            if not self.process.waitForFinished(3000):
+
+    def wait_terminate(self, timeout=3000):
+        """Wait up to timeout ms for uxterm to exit after request_terminate(), then kill it."""
+        if hasattr(self, 'process') and self.process.state() != QProcess.NotRunning:
+            if not self.process.waitForFinished(timeout):
                 self.process.kill()
-            logging.debug("uxterm process terminated.")
+            logger.debug("uxterm process terminated.")
 
     def resize_terminal(self):
         """Resize the terminal to match widget size."""
+        if not hasattr(self, 'process'):
+            return  # uxterm start is still queued
         try:
             pid = self.process.processId()
             if pid:
-                # Find uxterm windows for this process
-                cmd = f"xdotool search --pid {pid} --class UXTerm"
-                result = subprocess.check_output(cmd, shell=True).decode().strip()
-
-                if result:
-                    window_ids = result.split('\n')
+                # Find uxterm windows for this process; they live as long as the process
+                if not self._cached_window_ids:
+                    result = subprocess.check_output(
+                        ['xdotool', 'search', '--pid', str(pid), '--class', 'UXTerm']
+                    ).decode().strip()
+                    self._cached_window_ids = result.split('\n') if result else None
+
+                if self._cached_window_ids:
                     size = self.size()
 
-                    for window_id in window_ids:
-                        # Resize window
-                        resize_cmd = f"xdotool windowsize {window_id} {size.width()} {size.height()}"
-                        subprocess.run(resize_cmd, shell=True, check=True)
-
-                        # Update terminal dimensions
-                        char_width = 7  # Adjust these values based on your terminal font
-                        char_height = 15
-                        cols = max(1, int(size.width() / char_width))
-                        rows = max(1, int(size.height() / char_height))
-
-                        # Get the TTY of the uxterm process directly
-                        tty_cmd = f"ps -o tty= -p {pid}"
-                        tty_output = subprocess.check_output(tty_cmd, shell=True).decode().strip()
-                        if tty_output and tty_output != "?":  # Ensure valid TTY output
-                            pty_device = f"/dev/{tty_output}"
-                            stty_cmd = f"stty -F {pty_device} rows {rows} columns {cols}"
-                            subprocess.run(stty_cmd, shell=True, check=True)
+                    # Resize all windows with one chained xdotool invocation;
+                    # xterm updates its own pty size when its window is resized
+                    xdotool_command = ['xdotool']
+                    for window_id in self._cached_window_ids:
+                        xdotool_command += ['windowsize', window_id, str(size.width()), str(size.height())]
+                    subprocess.run(xdotool_command, check=True)
 
         except subprocess.CalledProcessError as e:
-
+            # The cached window IDs may be stale; search again on the next resize
+            self._cached_window_ids = None
             QMessageBox.warning(self, "Resize Warning", f"Error resizing terminal: {e}")
         except Exception as e:
 
             QMessageBox.warning(self, "Resize Warning", f"Unexpected error: {e}")
 
 
+    def showEvent(self, event):
+        """Run the initial resize deferred while the tab was hidden."""
+        super().showEvent(event)
+        if self._resize_pending:
+            self._resize_pending = False
+            QTimer.singleShot(100, self.resize_terminal)
+
     def eventFilter(self, obj, event):
         """Handle resize events."""
         if obj == self and event.type() == QEvent.Resize:
@@ -636,12 +868,26 @@ class TerminalEmulator(QMainWindow):
         self.tab_counter = 0  # Add counter for tab naming
         self.command_executed = False  # Flag to ensure command executes only once
         self.second_tab_widget = None  # Initialize second_tab_widget as None
+        # XTermWidgets in each pane, kept in sync with addTab/removeTab
+        self.main_terminals = []
+        self.second_terminals = []
+        self._about_dialog = None  # Created on first open_about_dialog()
+        self._spawn_queue = deque()  # XTermWidgets waiting to start uxterm
+        self._active_spawns = 0
+        # (action, qtawesome name) pairs of both menus; icons are set by load_menu_icons()
+        self._menu_icons = []
 
         # Load settings
+        self._qsettings = QSettings("Qermital", "TerminalEmulator")
         self.load_settings()
+        # Changed settings are flushed once on exit (also covers "Exit App")
+        QApplication.instance().aboutToQuit.connect(self.save_settings)
 
         self.initUI()
+        self.init_context_menu()
         self.init_tray()
+        # Menu icons pull in qtawesome; load them after the first window is shown
+        QTimer.singleShot(0, self.load_menu_icons)
         if self.start_minimized:
             self.hide()
             self.tray_icon.showMessage(
@@ -658,20 +904,15 @@ class TerminalEmulator(QMainWindow):
 
     def load_settings(self):
         """Load settings from QSettings or use defaults."""
-        self.settings = DEFAULT_SETTINGS.copy()
-        qsettings = QSettings("Qermital", "TerminalEmulator")
-        self.settings["font_family"] = qsettings.value("font_family", DEFAULT_SETTINGS["font_family"])
-        self.settings["font_size"] = int(qsettings.value("font_size", DEFAULT_SETTINGS["font_size"]))
-        self.settings["background_color"] = qsettings.value("background_color", DEFAULT_SETTINGS["background_color"])
-        self.settings["foreground_color"] = qsettings.value("foreground_color", DEFAULT_SETTINGS["foreground_color"])
+        self.settings = SettingsCache(self._qsettings, DEFAULT_SETTINGS)
+        self.settings.load("font_family", DEFAULT_SETTINGS["font_family"])
+        self.settings.load("font_size", DEFAULT_SETTINGS["font_size"], int)
+        self.settings.load("background_color", DEFAULT_SETTINGS["background_color"])
+        self.settings.load("foreground_color", DEFAULT_SETTINGS["foreground_color"])
 
     def save_settings(self):
-        """Save current settings to QSettings."""
-        qsettings = QSettings("Qermital", "TerminalEmulator")
-        qsettings.setValue("font_family", self.settings["font_family"])
-        qsettings.setValue("font_size", self.settings["font_size"])
-        qsettings.setValue("background_color", self.settings["background_color"])
-        qsettings.setValue("foreground_color", self.settings["foreground_color"])
+        """Write changed settings to QSettings and sync them to disk."""
+        self.settings.flush(sync=True)
 
     def initUI(self):
         """Initialize the main UI."""
@@ -709,106 +950,117 @@ class TerminalEmulator(QMainWindow):
         # Context menu for tabs
         self.main_tab_widget.setContextMenuPolicy(Qt.CustomContextMenu)
         self.main_tab_widget.customContextMenuRequested.connect(
-            lambda pos: self.show_context_menu(pos, self.main_tab_widget)
+            functools.partial(self.show_context_menu, tab_widget=self.main_tab_widget)
         )
 
-    def show_context_menu(self, position, tab_widget):
-        """Show context menu for the specified tab widget."""
-        context_menu = QMenu()
-
-        current_index = tab_widget.currentIndex()
-        if current_index == -1:
-            return  # No tab to act upon
+    def init_context_menu(self):
+        """Build the tab context menu once; show_context_menu reuses it."""
+        self._tab_menu = QMenu(self)  # Owns its actions
+        self._ctx_tw = None  # Tab widget and index the menu was opened for
+        self._ctx_idx = -1
 
         # Add "Add Tab" action
-        add_tab_icon = qta.icon('mdi.plus', color='blue', icon_size=(32, 32))
-        add_tab_action = QAction(add_tab_icon, "Add Tab", self)
-        add_tab_action.triggered.connect(
-            lambda: self.add_terminal_tab(
-                pane='main' if tab_widget == self.main_tab_widget else 'second'
-            )
-        )
-        context_menu.addAction(add_tab_action)
+        add_tab_action = QAction("Add Tab", self._tab_menu)
+        self._menu_icons.append((add_tab_action, 'mdi.plus'))
+        add_tab_action.triggered.connect(self.add_tab_from_context_menu)
+        self._tab_menu.addAction(add_tab_action)
 
-        # Add "Open Duality" action only for main_tab_widget
-        if tab_widget == self.main_tab_widget and not self.second_tab_widget:
-            open_half_icon = qta.icon('mdi.arrow-split-vertical', color='blue', icon_size=(32, 32))
-            open_half_action = QAction(open_half_icon, "Open Dual Pane", self)
-            open_half_action.triggered.connect(self.initialize_double_pane)
-            context_menu.addAction(open_half_action)
+        # Add "Open Duality" action, shown only for main_tab_widget
+        self._open_half_action = QAction("Open Dual Pane", self._tab_menu)
+        self._menu_icons.append((self._open_half_action, 'mdi.arrow-split-vertical'))
+        self._open_half_action.triggered.connect(self.initialize_double_pane)
+        self._tab_menu.addAction(self._open_half_action)
 
         # Add "Move Tab to Second Pane" action
-        move_tab_icon = qta.icon('mdi.arrow-right-bold-circle-outline', color='blue', icon_size=(32, 32))  # Choose an appropriate icon
-        move_tab_action = QAction(move_tab_icon, "Move Tab to Second Pane", self)
-        move_tab_action.triggered.connect(lambda: self.move_tab_to_second_pane(tab_widget, current_index))
-        context_menu.addAction(move_tab_action)
+        move_tab_action = QAction("Move Tab to Second Pane", self._tab_menu)
+        self._menu_icons.append((move_tab_action, 'mdi.arrow-right-bold-circle-outline'))  # Choose an appropriate icon
+        move_tab_action.triggered.connect(self.move_tab_from_context_menu)
+        self._tab_menu.addAction(move_tab_action)
 
-        # Add "Close Second Pane" action if splitter has two panes
-        if self.second_tab_widget:
-            close_half_icon = qta.icon('mdi.window-close', color='blue', icon_size=(32, 32))
-            close_half_action = QAction(close_half_icon, "Close Second Pane", self)
-            close_half_action.triggered.connect(self.close_second_half)
-            context_menu.addAction(close_half_action)
+        # Add "Close Second Pane" action, shown if splitter has two panes
+        self._close_half_action = QAction("Close Second Pane", self._tab_menu)
+        self._menu_icons.append((self._close_half_action, 'mdi.window-close'))
+        self._close_half_action.triggered.connect(self.close_second_half)
+        self._tab_menu.addAction(self._close_half_action)
 
         # Add "Rename Tab" action
-        rename_tab_icon = qta.icon('mdi.rename-box', color='blue', icon_size=(32, 32))
-        rename_tab_action = QAction(rename_tab_icon, "Rename Tab", self)
-        rename_tab_action.triggered.connect(
-            lambda: self.rename_tab(tab_widget, current_index)
-        )
-        context_menu.addAction(rename_tab_action)
+        rename_tab_action = QAction("Rename Tab", self._tab_menu)
+        self._menu_icons.append((rename_tab_action, 'mdi.rename-box'))
+        rename_tab_action.triggered.connect(self.rename_tab_from_context_menu)
+        self._tab_menu.addAction(rename_tab_action)
 
         # Add "Toggle Tabbar" action
-        toggle_tabbar_icon = qta.icon('mdi.toggle-switch', color='blue', icon_size=(32, 32))
-        toggle_tabbar_action = QAction(toggle_tabbar_icon, "Toggle Bar", self)
-        toggle_tabbar_action.triggered.connect(
-            lambda: self.toggle_tab_bar()
-        )
-        context_menu.addAction(toggle_tabbar_action)
+        toggle_tabbar_action = QAction("Toggle Bar", self._tab_menu)
+        self._menu_icons.append((toggle_tabbar_action, 'mdi.toggle-switch'))
+        toggle_tabbar_action.triggered.connect(self.toggle_tab_bar)
+        self._tab_menu.addAction(toggle_tabbar_action)
 
-        context_menu.addSeparator()
+        self._tab_menu.addSeparator()
 
         # Add "Settings" action
-        settings_icon = qta.icon('mdi.settings-helper', color='blue', icon_size=(32, 32))
-        settings_action = QAction(settings_icon, "Settings", self)
+        settings_action = QAction("Settings", self._tab_menu)
+        self._menu_icons.append((settings_action, 'mdi.settings-helper'))
         settings_action.triggered.connect(self.open_settings_dialog)
-        context_menu.addAction(settings_action)
+        self._tab_menu.addAction(settings_action)
 
         # Add "Minimize to Tray" action
-        minimize_tray_icon = qta.icon('mdi.window-minimize', color='blue', icon_size=(32, 32))
-        minimize_tray_action = QAction(minimize_tray_icon, "Minimize to Tray", self)
+        minimize_tray_action = QAction("Minimize to Tray", self._tab_menu)
+        self._menu_icons.append((minimize_tray_action, 'mdi.window-minimize'))
         minimize_tray_action.triggered.connect(self.hide)
-        context_menu.addAction(minimize_tray_action)
+        self._tab_menu.addAction(minimize_tray_action)
 
         # Add "Exit App" action
-        exit_app_icon = qta.icon('mdi.exit-to-app', color='blue', icon_size=(32, 32))
-        exit_app_action = QAction(exit_app_icon, "Exit App", self)
+        exit_app_action = QAction("Exit App", self._tab_menu)
+        self._menu_icons.append((exit_app_action, 'mdi.exit-to-app'))
         exit_app_action.triggered.connect(QApplication.instance().quit)
-        context_menu.addAction(exit_app_action)
+        self._tab_menu.addAction(exit_app_action)
+
+    def add_tab_from_context_menu(self):
+        """Add a tab to the pane the context menu was opened on."""
+        self.add_terminal_tab(pane='main' if self._ctx_tw == self.main_tab_widget else 'second')
+
+    def move_tab_from_context_menu(self):
+        """Move the tab the context menu was opened on to the second pane."""
+        self.move_tab_to_second_pane(self._ctx_tw, self._ctx_idx)
 
-        # Display the context menu at the cursor position
-        context_menu.exec(tab_widget.mapToGlobal(position))
+    def rename_tab_from_context_menu(self):
+        """Rename the tab the context menu was opened on."""
+        self.rename_tab(self._ctx_tw, self._ctx_idx)
+
+    def show_context_menu(self, position, tab_widget):
+        """Show context menu for the specified tab widget."""
+        current_index = tab_widget.currentIndex()
+        if current_index == -1:
+            return  # No tab to act upon
+
+        self._ctx_tw, self._ctx_idx = tab_widget, current_index
+        self._open_half_action.setVisible(tab_widget == self.main_tab_widget and not self.second_tab_widget)
+        self._close_half_action.setVisible(self.second_tab_widget is not None)
+
+        # Display the context menu at the cursor position without a nested event loop
+        self._tab_menu.popup(tab_widget.mapToGlobal(position))
 
     def open_settings_dialog(self):
         """Open the Settings Dialog."""
         dialog = SettingsDialog(self, settings=self.settings.copy())
         if dialog.exec() == QDialog.Accepted:
-            # Update settings with user selections
-            self.settings = dialog.get_settings()
-            self.save_settings()
-            logging.debug("Settings updated and saved.")
-
-            # Apply settings to existing terminal widgets
-            for index in range(self.main_tab_widget.count()):
-                tab = self.main_tab_widget.widget(index)
-                if isinstance(tab, XTermWidget):
+            new_settings = dialog.get_settings()
+            if all(self.settings.get(key) == value for key, value in new_settings.items()):
+                return  # Nothing changed, leave the terminals alone
+
+            # Update settings with user selections; QSettings batches the disk write,
+            # and the final sync happens on exit
+            self.settings.update(new_settings)
+            self.settings.flush()
+            logger.debug("Settings updated.")
+
+            # Apply settings to existing terminal widgets with a single repaint
+            self.setUpdatesEnabled(False)
+            try:
+                for tab in self.main_terminals + self.second_terminals:
                     tab.apply_settings(self.settings)
-
-            if self.second_tab_widget:
-                for index in range(self.second_tab_widget.count()):
-                    tab = self.second_tab_widget.widget(index)
-                    if isinstance(tab, XTermWidget):
-                        tab.apply_settings(self.settings)
+            finally:
+                self.setUpdatesEnabled(True)
 
     def get_resource_path(self, relative_path):
         """Get absolute path to resource, works for dev and for PyInstaller."""
@@ -827,35 +1079,35 @@ class TerminalEmulator(QMainWindow):
         self.tray_icon.setToolTip("Qermital Terminal Emulator")
 
         # Create tray context menu
-        tray_menu = QMenu()
+        tray_menu = QMenu(self)  # Owns its actions
 
         # Restore Action
-        restore_icon = qta.icon('mdi.home', color='blue', icon_size=(32, 32))  # Using mdi.home as an example
-        restore_action = QAction(restore_icon, "Restore", self)
+        restore_action = QAction("Restore", tray_menu)
+        self._menu_icons.append((restore_action, 'mdi.home'))  # Using mdi.home as an example
         restore_action.triggered.connect(self.show_normal)
         tray_menu.addAction(restore_action)
 
         # Minimize Action
-        minimize_icon = qta.icon('mdi.window-minimize', color='blue', icon_size=(32, 32))
-        minimize_action = QAction(minimize_icon, "Minimize to Tray", self)
+        minimize_action = QAction("Minimize to Tray", tray_menu)
+        self._menu_icons.append((minimize_action, 'mdi.window-minimize'))
         minimize_action.triggered.connect(self.hide)
         tray_menu.addAction(minimize_action)
 
         # Settings Action
-        settings_icon = qta.icon('mdi.cog', color='blue', icon_size=(32, 32))
-        settings_action = QAction(settings_icon, "Settings", self)
+        settings_action = QAction("Settings", tray_menu)
+        self._menu_icons.append((settings_action, 'mdi.cog'))
         settings_action.triggered.connect(self.open_settings_dialog)
         tray_menu.addAction(settings_action)
 
         # About Action
-        about_icon = qta.icon('mdi.information', color='blue', icon_size=(32, 32))
-        about_action = QAction(about_icon, "About", self)
+        about_action = QAction("About", tray_menu)
+        self._menu_icons.append((about_action, 'mdi.information'))
         about_action.triggered.connect(self.open_about_dialog)
         tray_menu.addAction(about_action)
 
         # Exit Action
-        exit_icon = qta.icon('mdi.exit-to-app', color='blue', icon_size=(32, 32))
-        exit_action = QAction(exit_icon, "Exit App", self)
+        exit_action = QAction("Exit App", tray_menu)
+        self._menu_icons.append((exit_action, 'mdi.exit-to-app'))
         exit_action.triggered.connect(QApplication.instance().quit)
         tray_menu.addAction(exit_action)
 
@@ -866,6 +1118,12 @@ class TerminalEmulator(QMainWindow):
 
         self.tray_icon.show()
 
+    def load_menu_icons(self):
+        """Set the context and tray menu icons once the window is up."""
+        for action, icon_name in self._menu_icons:
+            action.setIcon(_icon(icon_name))
+        self._menu_icons.clear()
+
     def toggle_tab_bar(self):
         # Toggle visibility of the tab bar
         is_visible = self.main_tab_widget.tabBar().isVisible()
@@ -875,15 +1133,11 @@ class TerminalEmulator(QMainWindow):
 
 
     def open_about_dialog(self):
-        try:
-            dialog = AboutDialog(None)  # Pass None as parent to avoid TypeError
-            dialog.exec()
-        except TypeError as e:
-            QMessageBox.critical(
-                None,
-                "Error Opening About Dialog",
-                f"An error occurred while opening the About dialog:\n{e}"
-            )
+        # The dialog is built on first use and reused; as a Qt.Popup it closes on focus out
+        if self._about_dialog is None:
+            self._about_dialog = AboutDialog(None)  # Pass None as parent to avoid TypeError
+        self._about_dialog.show()
+        self._about_dialog.raise_()
 
     def on_tray_icon_activated(self, reason):
         """Handle tray icon activation."""
@@ -892,13 +1146,14 @@ class TerminalEmulator(QMainWindow):
 
     def show_normal(self):
         """Restore the window from the tray and bring it to the front."""
-        self.show()
-        self.raise_()
-        self.activateWindow()
-        # Additional steps to ensure the window is on top
-        self.setWindowState(self.windowState() & ~Qt.WindowMinimized | Qt.WindowActive)
-        self.raise_()
-        self.activateWindow()
+        # Each step is a window system round-trip, so skip the ones already satisfied
+        if not self.isVisible():
+            self.show()
+        if self.isMinimized():
+            self.setWindowState(self.windowState() & ~Qt.WindowMinimized | Qt.WindowActive)
+        if not self.isActiveWindow():
+            self.raise_()
+            self.activateWindow()
 
     def add_terminal_tab(self, directory=None, command=None, pane='main'):
         """Add a new terminal tab to the specified pane."""
@@ -926,20 +1181,68 @@ class TerminalEmulator(QMainWindow):
                 cmd = command
 
         self.tab_counter += 1  # Increment counter
-        terminal_widget = XTermWidget(initial_directory=directory, command=cmd, parent=self)
-        terminal_widget.apply_settings(self.settings)  # Apply current settings to the new tab
+        terminal_widget = XTermWidget(
+            initial_directory=directory,
+            command=cmd,
+            parent=self,
+            settings=self.settings,  # Apply current settings to the new tab
+            spawner=self
+        )
 
         tab_label = f"Terminal {self.tab_counter}"
         if pane == 'main':
-            self.main_tab_widget.addTab(terminal_widget, tab_label)
+            self.add_tab_to(self.main_tab_widget, terminal_widget, tab_label)
             self.main_tab_widget.setCurrentWidget(terminal_widget)
         elif pane == 'second' and self.second_tab_widget:
-            self.second_tab_widget.addTab(terminal_widget, tab_label)
+            self.add_tab_to(self.second_tab_widget, terminal_widget, tab_label)
             self.second_tab_widget.setCurrentWidget(terminal_widget)
 
         # Bring the window to front after adding a new tab
         self.show_normal()
 
+    def terminals_of(self, tab_widget):
+        """Return the list of XTermWidgets tracked for the given pane."""
+        return self.main_terminals if tab_widget is self.main_tab_widget else self.second_terminals
+
+    def add_tab_to(self, tab_widget, terminal, label):
+        """Add a terminal tab to a pane and track it."""
+        tab_widget.addTab(terminal, label)
+        self.terminals_of(tab_widget).append(terminal)
+
+    def remove_tab_from(self, tab_widget, index):
+        """Remove a tab from a pane, stop tracking it and return its terminal."""
+        terminal = tab_widget.widget(index)
+        tab_widget.removeTab(index)
+        terminals = self.terminals_of(tab_widget)
+        if terminal in terminals:
+            terminals.remove(terminal)
+        return terminal
+
+    def queue_spawn(self, terminal):
+        """Queue a terminal to start uxterm, keeping concurrent starts bounded."""
+        if terminal not in self._spawn_queue:
+            self._spawn_queue.append(terminal)
+        # Defer so the new tab is added and shown before choosing what to start
+        QTimer.singleShot(0, self.process_spawn_queue)
+
+    def cancel_spawn(self, terminal):
+        """Drop a queued terminal that no longer needs to start."""
+        if terminal in self._spawn_queue:
+            self._spawn_queue.remove(terminal)
+
+    def spawn_finished(self, terminal):
+        """Free a spawn slot and start the next queued terminal."""
+        self._active_spawns = max(0, self._active_spawns - 1)
+        QTimer.singleShot(0, self.process_spawn_queue)
+
+    def process_spawn_queue(self):
+        """Start queued terminals while spawn slots are free, visible tabs first."""
+        while self._spawn_queue and self._active_spawns < MAX_CONCURRENT_SPAWNS:
+            terminal = next((t for t in self._spawn_queue if t.isVisible()), self._spawn_queue[0])
+            self._spawn_queue.remove(terminal)
+            self._active_spawns += 1
+            terminal.start_uxterm()
+
     def initialize_double_pane(self):
         """Initialize both panes with at least one tab each."""
         # Ensure main pane has at least one tab
@@ -953,10 +1256,8 @@ class TerminalEmulator(QMainWindow):
 
     def close_main_tab(self, index):
         """Close the specified tab in the main pane."""
-        tab = self.main_tab_widget.widget(index)
-        if isinstance(tab, XTermWidget):
-            tab.terminate()
-        self.main_tab_widget.removeTab(index)
+        tab = self.remove_tab_from(self.main_tab_widget, index)
+        tab.terminate()
 
         if self.main_tab_widget.count() == 0:
             self.tab_counter = 0  # Reset counter when all tabs are closed
@@ -969,21 +1270,19 @@ class TerminalEmulator(QMainWindow):
             QMessageBox.warning(self, "Move Tab", "Only tabs from the main pane can be moved to the second pane.")
             return
 
-        tab = tab_widget.widget(index)
-        if isinstance(tab, XTermWidget):
-            tab_label = tab_widget.tabText(index)
-            tab_widget.removeTab(index)
+        tab_label = tab_widget.tabText(index)
+        tab = self.remove_tab_from(tab_widget, index)
 
-            # Ensure the second pane exists
-            if not self.second_tab_widget:
-                self.create_second_pane()
+        # Ensure the second pane exists
+        if not self.second_tab_widget:
+            self.create_second_pane()
 
-            # Move the tab to the second pane
-            self.second_tab_widget.addTab(tab, tab_label)
-            self.second_tab_widget.setCurrentWidget(tab)
+        # Move the tab to the second pane
+        self.add_tab_to(self.second_tab_widget, tab, tab_label)
+        self.second_tab_widget.setCurrentWidget(tab)
 
-            if self.main_tab_widget.count() == 0:
-                self.add_terminal_tab(pane='main')
+        if self.main_tab_widget.count() == 0:
+            self.add_terminal_tab(pane='main')
 
     def create_second_pane(self):
         """Create the second pane and set up its properties."""
@@ -997,7 +1296,23 @@ class TerminalEmulator(QMainWindow):
         self.second_tab_widget.setMinimumWidth(300)  # Prevent shrinking
 
         # Add second_tab_widget to splitter
+        self.splitter.setUpdatesEnabled(False)
         self.splitter.addWidget(self.second_tab_widget)
+        self.splitter.setUpdatesEnabled(True)
+
+        # Size the panes once the splitter has laid out the new widget
+        QTimer.singleShot(0, self._equalize_panes)
+
+        # Update context menus for the second_tab_widget
+        self.second_tab_widget.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.second_tab_widget.customContextMenuRequested.connect(
+            functools.partial(self.show_context_menu, tab_widget=self.second_tab_widget)
+        )
+
+    def _equalize_panes(self):
+        """Divide the window in half and lock the splitter handle."""
+        if not self.second_tab_widget:
+            return  # Second pane was closed before this ran
 
         # Always divide window in half
         total_width = self.splitter.size().width()
@@ -1008,24 +1323,28 @@ class TerminalEmulator(QMainWindow):
         if self.splitter.count() > 1:
             self.splitter.handle(1).setEnabled(False)
 
-        # Update context menus for the second_tab_widget
-        self.second_tab_widget.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.second_tab_widget.customContextMenuRequested.connect(
-            lambda pos: self.show_context_menu(pos, self.second_tab_widget)
-        )
-
     def close_second_half(self):
         """Close the second half and expand the main tab widget to occupy the full width."""
         if not self.second_tab_widget:
             QMessageBox.information(self, "Info", "Second pane is already closed.")
             return
 
-        # Move all tabs from the second_tab_widget back to the main_tab_widget
-        while self.second_tab_widget.count() > 0:
-            tab_widget = self.second_tab_widget.widget(0)
-            tab_label = self.second_tab_widget.tabText(0)
-            self.second_tab_widget.removeTab(0)
-            self.main_tab_widget.addTab(tab_widget, tab_label)
+        # Move all tabs from the second_tab_widget back to the main_tab_widget,
+        # with updates and signals paused so both relayout only once
+        tab_widget = None
+        for pane in (self.main_tab_widget, self.second_tab_widget):
+            pane.setUpdatesEnabled(False)
+            pane.blockSignals(True)
+        try:
+            while self.second_tab_widget.count() > 0:
+                tab_label = self.second_tab_widget.tabText(0)
+                tab_widget = self.remove_tab_from(self.second_tab_widget, 0)
+                self.add_tab_to(self.main_tab_widget, tab_widget, tab_label)
+        finally:
+            for pane in (self.main_tab_widget, self.second_tab_widget):
+                pane.blockSignals(False)
+                pane.setUpdatesEnabled(True)
+        if tab_widget:
             self.main_tab_widget.setCurrentWidget(tab_widget)
 
         # Remove the second_tab_widget from the splitter
@@ -1045,10 +1364,8 @@ class TerminalEmulator(QMainWindow):
             QMessageBox.information(self, "Info", "No tabs to close in the second pane.")
             return
 
-        tab_widget = self.second_tab_widget.widget(index)
-        if isinstance(tab_widget, XTermWidget):
-            tab_widget.terminate()
-        self.second_tab_widget.removeTab(index)
+        tab_widget = self.remove_tab_from(self.second_tab_widget, index)
+        tab_widget.terminate()
 
         # If second_tab_widget has no more tabs, remove it
         if self.second_tab_widget.count() == 0:
@@ -1065,10 +1382,8 @@ class TerminalEmulator(QMainWindow):
     def close_tab(self, tab_widget, index):
         """Close the specified tab in the given tab widget."""
         if isinstance(tab_widget, QTabWidget):
-            tab = tab_widget.widget(index)
-            if isinstance(tab, XTermWidget):
-                tab.terminate()
-            tab_widget.removeTab(index)
+            tab = self.remove_tab_from(tab_widget, index)
+            tab.terminate()
 
             # If main_tab_widget has no more tabs, reset counter and add a new tab
             if tab_widget == self.main_tab_widget and tab_widget.count() == 0:
@@ -1111,17 +1426,16 @@ class TerminalEmulator(QMainWindow):
         )
 
         if reply == QMessageBox.Yes:
-            # Terminate all terminal processes in main_tab_widget
-            for index in range(self.main_tab_widget.count()):
-                tab = self.main_tab_widget.widget(index)
-                if isinstance(tab, XTermWidget):
-                    tab.terminate()
-            # Terminate all terminal processes in second_tab_widget
-            if self.second_tab_widget:
-                for index in range(self.second_tab_widget.count()):
-                    tab = self.second_tab_widget.widget(index)
-                    if isinstance(tab, XTermWidget):
-                        tab.terminate()
+            # Terminal processes in main_tab_widget and second_tab_widget
+            terminals = self.main_terminals + self.second_terminals
+            # Signal all of them first, then wait, so shutdown takes as long
+            # as the slowest terminal rather than the sum of all of them
+            for tab in terminals:
+                tab.request_terminate()
+            deadline = time.monotonic() + 3
+            for tab in terminals:
+                tab.wait_terminate(max(0, int((deadline - time.monotonic()) * 1000)))
+            self.save_settings()
             self.tray_icon.hide()
             event.accept()
             QApplication.quit()
@@ -1129,25 +1443,23 @@ class TerminalEmulator(QMainWindow):
             event.ignore()
 
     def handle_new_instance_message(self, message):
-        """Handle incoming messages from new instances."""
+        """Handle incoming messages (raw payload bytes) from new instances."""
         try:
-            data = json.loads(message)
-            action = data.get('action')
-            folder = data.get('folder', None)
-            command = data.get('command', None)
-
-            if action == 'open_new_tab':
-                if folder and os.path.isdir(folder):
-                    self.add_terminal_tab(directory=folder, command=command)
-                else:
-                    self.add_terminal_tab(command=command)
-
-                # Bring the window to front
-                self.show_normal()
-        except json.JSONDecodeError:
-            # If message is not JSON, default behavior
+            action, folder, command = parse_instance_message(message)
+        except ValueError:
+            # If message is malformed, default behavior
             self.add_terminal_tab()
             self.show_normal()
+            return
+
+        if action == 'open_new_tab':
+            if folder and os.path.isdir(folder):
+                self.add_terminal_tab(directory=folder, command=command)
+            else:
+                self.add_terminal_tab(command=command)
+
+            # Bring the window to front
+            self.show_normal()
 
 
 class AboutDialog(QDialog):
@@ -1188,6 +1500,93 @@ class AboutDialog(QDialog):
         super().focusOutEvent(event)
 
 
+@functools.lru_cache(maxsize=None)
+def single_instance_server_name():
+    """
+    Return the per-user socket path for the single-instance server.
+    The socket lives in $XDG_RUNTIME_DIR (private to the user) or, if that
+    is unset, in a 0700 ~/.cache/qermital directory, and its name includes
+    the uid, so other users can neither connect to nor squat on it.
+    """
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir and os.path.isdir(runtime_dir):
+        socket_dir = Path(runtime_dir)
+    else:
+        socket_dir = HOME / '.cache' / 'qermital'
+        socket_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        socket_dir.chmod(0o700)
+    return str(socket_dir / f"{SERVER_NAME}-{os.getuid()}")
+
+def build_instance_message(args):
+    """
+    Encode the request sent to the primary instance to open a new tab.
+    The payload is the action, folder and command, each as a 4-byte
+    big-endian length followed by UTF-8 text (empty when not given).
+    """
+    payload = b''
+    for field in ('open_new_tab', args.folder or '', args.command or ''):
+        encoded = field.encode('utf-8')
+        payload += struct.pack('>I', len(encoded)) + encoded
+    # Send the message length first
+    return struct.pack('>I', len(payload)) + payload
+
+def parse_instance_message(payload):
+    """
+    Decode a payload produced by build_instance_message.
+
+    Returns:
+        tuple: (action, folder, command); folder and command are None when empty.
+
+    Raises:
+        ValueError: If the payload is malformed.
+    """
+    fields = []
+    offset = 0
+    for _ in range(3):
+        if offset + 4 > len(payload):
+            raise ValueError("Truncated instance message.")
+        (length,) = struct.unpack_from('>I', payload, offset)
+        offset += 4
+        if offset + length > len(payload):
+            raise ValueError("Truncated instance message.")
+        fields.append(payload[offset:offset + length].decode('utf-8'))
+        offset += length
+    action, folder, command = fields
+    return action, folder or None, command or None
+
+def send_to_running_instance(args):
+    """
+    Try to hand the request to an already running primary instance
+    before any QApplication is created.
+
+    Connects with a plain AF_UNIX socket to the per-user socket path
+    QLocalServer listens on (Linux only) and sends the message only if
+    the peer runs as the same user, checked with SO_PEERCRED.
+
+    Returns:
+        True if the message was delivered, False if no instance of this
+        user answered; the caller then falls back to the Qt code path.
+    """
+    import socket
+    if not hasattr(socket, 'SO_PEERCRED') or not sys.platform.startswith('linux'):
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1.0)
+            sock.connect(single_instance_server_name())
+            # struct ucred: pid, uid, gid
+            creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('iII'))
+            _, peer_uid, _ = struct.unpack('iII', creds)
+            if peer_uid != os.getuid():
+                logger.warning("Single-instance socket is owned by uid %d, not sending to it.", peer_uid)
+                return False
+            sock.sendall(build_instance_message(args))
+    except OSError:
+        return False
+    logger.debug("Message sent to the primary instance before Qt startup.")
+    return True
+
+
 class SingleInstanceApplication(QApplication):
     """A QApplication subclass that ensures only a single instance runs."""
 
@@ -1197,79 +1596,110 @@ class SingleInstanceApplication(QApplication):
         self.socket = None
         self.main_window = None
         self.args = args
+        self._receive_buffers = {}  # Bytes received so far, per client connection
 
-        # Attempt to create a QLocalServer
+        # Attempt to create a QLocalServer, accessible only to this user
+        server_name = single_instance_server_name()
         self.server = QLocalServer()
-        if self.server.listen(SERVER_NAME):
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        if not self.server.listen(server_name) and not self.instance_running():
+            # A crashed instance left its socket file behind
+            QLocalServer.removeServer(server_name)
+            self.server.listen(server_name)
+        if self.server.isListening():
             # No existing instance is running; this instance is the primary
             self.server.newConnection.connect(self.receive_message)
-            logging.debug("No existing instance detected. Running as primary instance.")
+            logger.debug("No existing instance detected. Running as primary instance.")
         else:
             # An existing instance is running; send a message to it
-            logging.debug("Another instance detected. Sending message to open a new tab.")
+            logger.debug("Another instance detected. Sending message to open a new tab.")
             self.send_message()
             sys.exit(0)  # Exit the new instance
 
+    def instance_running(self):
+        """Check whether a primary instance answers on the server socket."""
+        socket = QLocalSocket()
+        socket.connectToServer(single_instance_server_name())
+        running = socket.waitForConnected(500)
+        socket.abort()
+        return running
+
     def send_message(self):
         """Send a message to the primary instance to open a new tab."""
         socket = QLocalSocket()
-        socket.connectToServer(SERVER_NAME)
+        socket.connectToServer(single_instance_server_name())
         if not socket.waitForConnected(1000):
             QMessageBox.warning(None, "Qermital", "Unable to connect to the running instance.")
             return
-        # Prepare the message with potential arguments
-        message = {
-            'action': 'open_new_tab',
-            'folder': self.args.folder if self.args.folder else None,
-            'command': self.args.command if self.args.command else None
-        }
-        message_json = json.dumps(message).encode('utf-8')
-        # Send the message length first
-        length = len(message_json)
-        socket.write(bytes(f"{length:08}", 'utf-8'))  # 8-byte header for message length
-        socket.write(message_json)
+        socket.write(build_instance_message(self.args))
         socket.flush()
         socket.waitForBytesWritten(1000)
         socket.disconnectFromServer()
-        logging.debug("Message sent to the primary instance.")
+        logger.debug("Message sent to the primary instance.")
 
     @Slot()
     def receive_message(self):
         """Handle incoming messages from new instances."""
         while self.server.hasPendingConnections():
             client_connection = self.server.nextPendingConnection()
-            client_connection.readyRead.connect(lambda: self.read_socket(client_connection))
+            self._receive_buffers[client_connection] = b''
+            client_connection.readyRead.connect(functools.partial(self.read_socket, client_connection))
+            client_connection.disconnected.connect(functools.partial(self.drop_connection, client_connection))
 
-    def read_socket(self, socket):
-        """Read data from the socket and perform actions."""
-        # First, read the 8-byte length header
-        if socket.bytesAvailable() < 8:
-            return  # Not enough data yet
+    def drop_connection(self, socket):
+        """Forget a client connection once it has disconnected."""
+        self._receive_buffers.pop(socket, None)
+        socket.deleteLater()
 
-        length_data = socket.read(8)
-        try:
-            # Convert QByteArray to bytes before decoding
-            length = int(bytes(length_data).decode('utf-8'))
-        except ValueError:
-            QMessageBox.warning(None, "Qermital", "Received invalid message length.")
-            socket.disconnectFromServer()
+    def read_socket(self, socket):
+        """
+        Collect data from the socket and perform actions.
+        Bytes are buffered across readyRead signals, so a slow sender
+        never blocks the event loop.
+        """
+        if socket not in self._receive_buffers:
+            return  # Message already handled or rejected
+        data = self._receive_buffers[socket] + bytes(socket.readAll())
+        self._receive_buffers[socket] = data
+        if len(data) < MESSAGE_HEADER_SIZE:
             return
 
-        # Wait until the full message is received
-        if socket.bytesAvailable() < length:
-            # Not all data received yet
+        # The 4-byte big-endian length header comes first
+        length = int.from_bytes(data[:MESSAGE_HEADER_SIZE], 'big')
+        if length > MAX_MESSAGE_SIZE:
+            logger.warning("Rejected a %d byte message from a new instance.", length)
+            del self._receive_buffers[socket]
+            socket.abort()
+            socket.deleteLater()
             return
+        if len(data) < MESSAGE_HEADER_SIZE + length:
+            return  # Wait for the rest of the message
 
-        message_data = socket.read(length)
+        del self._receive_buffers[socket]
+        message_data = data[MESSAGE_HEADER_SIZE:MESSAGE_HEADER_SIZE + length]
         if message_data:
-            # Convert QByteArray to bytes before decoding
-            message = bytes(message_data).decode('utf-8')
             if self.main_window:
-                self.main_window.handle_new_instance_message(message)
-            logging.debug("Received message from a new instance.")
+                self.main_window.handle_new_instance_message(message_data)
+            logger.debug("Received message from a new instance.")
         socket.disconnectFromServer()
 
 
+@functools.lru_cache(maxsize=None)
+def _load_qss(path_str):
+    """Read a stylesheet file once per process."""
+    with open(path_str, "r") as f:
+        return f.read()
+
+def apply_stylesheet(app, qss_path):
+    """Apply the stylesheet at qss_path to app, reporting read errors."""
+    try:
+        app.setStyleSheet(_load_qss(str(qss_path)))
+        logger.debug("Custom stylesheet loaded successfully.")
+    except Exception as e:
+        QMessageBox.warning(None, "Style Error", f"Error loading style: {e}")
+        logger.error("Error loading stylesheet: %s", e)
+
+
 def parse_arguments():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(description="Qermital Terminal Emulator")
@@ -1288,19 +1718,16 @@ def main():
     if args.new:
         # Launch a new instance regardless of existing instances
         app = QApplication(sys.argv)
+        check_dependencies()
+        import qdarktheme
         qdarktheme.setup_theme()
+        QTimer.singleShot(500, create_qermital_desktop_entry)  # Off the startup path
 
         '''
         # Apply custom stylesheet if it exists - optional
         qss_path = Path(__file__).parent / "chros_style.qss"
         if qss_path.exists():
-            try:
-                with open(qss_path, "r") as f:
-                    app.setStyleSheet(f.read())
-                logging.debug("Custom stylesheet loaded successfully.")
-            except Exception as e:
-                QMessageBox.warning(None, "Style Error", f"Error loading style: {e}")
-                logging.error(f"Error loading stylesheet: {e}")
+            QTimer.singleShot(0, lambda: apply_stylesheet(app, qss_path))
         '''
 
         terminal_emulator = TerminalEmulator(
@@ -1313,24 +1740,24 @@ def main():
 
         if not args.tray:
             terminal_emulator.show()
-            logging.debug("Terminal emulator window shown.")
+            logger.debug("Terminal emulator window shown.")
 
         sys.exit(app.exec())
     else:
-        # Enforce single-instance behavior
+        # Enforce single-instance behavior; a running instance is probed
+        # first so secondary launches skip QApplication construction
+        if send_to_running_instance(args):
+            sys.exit(0)
         app = SingleInstanceApplication(sys.argv, args)
+        check_dependencies()
+        import qdarktheme
         qdarktheme.setup_theme()
+        QTimer.singleShot(500, create_qermital_desktop_entry)  # Off the startup path
 
-        # Apply custom stylesheet if exists
+        # Apply custom stylesheet if exists, after the first window paint
         qss_path = Path(__file__).parent / "chros_style.qss"
         if qss_path.exists():
-            try:
-                with open(qss_path, "r") as f:
-                    app.setStyleSheet(f.read())
-                logging.debug("Custom stylesheet loaded successfully.")
-            except Exception as e:
-                QMessageBox.warning(None, "Style Error", f"Error loading style: {e}")
-                logging.error(f"Error loading stylesheet: {e}")
+            QTimer.singleShot(0, lambda: apply_stylesheet(app, qss_path))
 
         terminal_emulator = TerminalEmulator(
             initial_directory=args.folder,
@@ -1340,15 +1767,14 @@ def main():
             start_maximized=args.max
         )
         app.main_window = terminal_emulator  # Assign the main window for communication
-        logging.debug("Main window assigned to SingleInstanceApplication.")
+        logger.debug("Main window assigned to SingleInstanceApplication.")
 
         if not args.tray:
             terminal_emulator.show()
-            logging.debug("Terminal emulator window shown.")
+            logger.debug("Terminal emulator window shown.")
 
         sys.exit(app.exec())
 
 
 if __name__ == '__main__':
-    create_qermital_desktop_entry()
     main()